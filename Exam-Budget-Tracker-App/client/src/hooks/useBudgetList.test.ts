@@ -29,7 +29,7 @@ describe('useBudgetList', () => {
 
   it('returns budgets and query state', () => {
     vi.spyOn(useBudgetsModule, 'useBudgets').mockReturnValue({
-      data: { count: 1, next: null, previous: null, results: mockBudgets },
+      data: { next: null, previous: null, results: mockBudgets },
       isLoading: false,
       error: null,
       refetch: mockRefetch,
@@ -54,7 +54,7 @@ describe('useBudgetList', () => {
     });
 
     vi.spyOn(useBudgetsModule, 'useBudgets').mockReturnValue({
-      data: { count: 1, next: null, previous: null, results: mockBudgets },
+      data: { next: null, previous: null, results: mockBudgets },
       isLoading: false,
       error: null,
       refetch: mockRefetch,
@@ -83,7 +83,7 @@ describe('useBudgetList', () => {
 
   it('clears delete confirmation on cancel', () => {
     vi.spyOn(useBudgetsModule, 'useBudgets').mockReturnValue({
-      data: { count: 1, next: null, previous: null, results: mockBudgets },
+      data: { next: null, previous: null, results: mockBudgets },
       isLoading: false,
       error: null,
       refetch: mockRefetch,
@@ -29,7 +29,6 @@ describe('useBudgets', () => {
 
   it('fetches budgets successfully', async () => {
     const mockData: BudgetListResponse = {
-      count: 2,
       next: null,
       previous: null,
       results: [
@@ -75,7 +74,6 @@ describe('useBudgets', () => {
 
   it('uses correct query key', async () => {
     const mockData: BudgetListResponse = {
-      count: 0,
       next: null,
       previous: null,
       results: [],
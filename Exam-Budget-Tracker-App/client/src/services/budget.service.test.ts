@@ -16,7 +16,6 @@ describe('budgetService', () => {
 
   it('getBudgets calls the correct endpoint', async () => {
     const mockResponse = {
-      count: 0,
       next: null,
       previous: null,
       results: [],
@@ -27,7 +26,7 @@ describe('budgetService', () => {
     const result = await budgetService.getBudgets();
 
     expect(result).toEqual(mockResponse);
-    expect(requester).toHaveBeenCalledWith('/api/budgets/', { method: 'GET' });
+    expect(requester).toHaveBeenCalledWith('/api/budgets/?fields=description', { method: 'GET' });
   });
 
   it('getBudgetById calls the correct endpoint with ID', async () => {
@@ -8,7 +8,7 @@ export const budgetService = {
    * Fetch all budgets for the authenticated user
    */
   getBudgets: async (): Promise<BudgetListResponse> => {
-    return requester<BudgetListResponse>(`${BUDGET_API_URL}/`, {
+    return requester<BudgetListResponse>(`${BUDGET_API_URL}/?fields=description`, {
       method: 'GET',
     });
   },
@@ -27,7 +27,6 @@ export interface UpdateBudgetPayload {
 }
 
 export interface BudgetListResponse {
-  count: number;
   next: string | null;
   previous: string | null;
   results: Budget[];
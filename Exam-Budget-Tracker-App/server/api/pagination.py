@@ -0,0 +1,112 @@
+import json
+import math
+
+from django.core.paginator import EmptyPage, Page, Paginator
+from django.db import connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+from django.utils.translation import gettext_lazy as _
+from rest_framework.pagination import PageNumberPagination
+
+
+class EstimatedCountPage(Page):
+    """Page whose next link comes from the rows actually fetched, not from the count"""
+
+    def __init__(self, object_list, number, paginator, has_next):
+        super().__init__(object_list, number, paginator)
+        self._has_next = has_next
+
+    def has_next(self):
+        return self._has_next
+
+    def next_page_number(self):
+        if not self._has_next:
+            raise EmptyPage(_('That page contains no results'))
+        return self.number + 1
+
+    def previous_page_number(self):
+        if self.number <= 1:
+            raise EmptyPage(_('That page number is less than 1'))
+        return self.number - 1
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator that counts exactly up to a limit and estimates beyond it
+
+    The exact count is a COUNT(*) over at most `exact_count_limit + 1` rows.
+    Past that, Postgres reports the planner's row estimate for the filtered
+    query instead of scanning every matching row; other backends count exactly.
+    An estimated count is only reported: page validation, the next link and
+    ?page=last follow the real rows, whichever way the estimate is off.
+    """
+
+    exact_count_limit = 10000
+    count_is_estimate = False
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not isinstance(queryset, QuerySet):
+            return super().count
+
+        queryset = queryset.order_by()
+        capped = queryset[:self.exact_count_limit + 1].count()
+        if capped <= self.exact_count_limit:
+            return capped
+        self.count_is_estimate = True
+        return max(self._estimate(queryset), capped)
+
+    def validate_number(self, number):
+        try:
+            return super().validate_number(number)
+        except EmptyPage:
+            if not self.count_is_estimate or int(number) < 1:
+                raise
+        number = int(number)
+        bottom = (number - 1) * self.per_page
+        if not self.object_list[bottom:bottom + 1].exists():
+            raise EmptyPage(_('That page contains no results'))
+        return number
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if not self.count_is_estimate:
+            return super().page(number)
+
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom:bottom + self.per_page + 1])
+        if not rows and number > 1:
+            # An overestimate lets page numbers past the real rows through validate_number
+            raise EmptyPage(_('That page contains no results'))
+        return EstimatedCountPage(rows[:self.per_page], number, self, has_next=len(rows) > self.per_page)
+
+    def last_page_number(self):
+        """The real last page; an estimated num_pages may point past it or short of it"""
+        num_pages = self.num_pages
+        if not self.count_is_estimate:
+            return num_pages
+        return max(1, math.ceil(self.object_list.count() / self.per_page))
+
+    def _estimate(self, queryset):
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return queryset.count()
+
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN (FORMAT JSON) {sql}', params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]['Plan']['Plan Rows'])
+
+
+class EstimatedCountPageNumberPagination(PageNumberPagination):
+    django_paginator_class = EstimatedCountPaginator
+
+    def get_page_number(self, request, paginator):
+        page_number = request.query_params.get(self.page_query_param, 1)
+        if page_number in self.last_page_strings:
+            # Counts exactly when the count is estimated, so ?page=last is the real last page
+            page_number = paginator.last_page_number()
+        return page_number
@@ -5,7 +5,8 @@ class IsOwner(BasePermission):
     """Allow access only to objects owned by the authenticated user."""
 
     def has_object_permission(self, request, view, obj):
-        owner = getattr(obj, 'user', None)
-        if owner is None and hasattr(obj, 'budget'):
-            owner = getattr(obj.budget, 'user', None)
-        return owner == request.user
+        # Compare ids so neither the owner nor request.user has to be loaded
+        owner_id = getattr(obj, 'user_id', None)
+        if owner_id is None and hasattr(obj, 'budget'):
+            owner_id = getattr(obj.budget, 'user_id', None)
+        return owner_id is not None and owner_id == request.user.pk
@@ -0,0 +1,18 @@
+import copy
+
+
+class CachedFieldsMixin:
+    """Build a serializer's field map once per class and hand out shallow copies
+
+    Skips the per-instance deepcopy of declared fields and, for ModelSerializer,
+    the model introspection that get_fields() repeats on every instantiation.
+    """
+
+    # Field map built by get_fields(), shared by every instance of the class
+    _field_cache = None
+
+    def get_fields(self):
+        cls = type(self)
+        if cls.__dict__.get('_field_cache') is None:
+            cls._field_cache = super().get_fields()
+        return {name: copy.copy(field) for name, field in cls._field_cache.items()}
@@ -63,6 +63,46 @@ DATABASES = {
     }
 }
 
+REDIS_URL = config('REDIS_URL', default='')
+
+# 'blacklist' holds the only copy of the JWT blacklist (users.blacklist) and must
+# never evict: a dropped entry re-enables a logged-out refresh token. It is kept
+# apart from 'default', which fills up with cached budget pages. On Redis the
+# server must run with maxmemory-policy noeviction (the Redis default).
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        },
+        'blacklist': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            'KEY_PREFIX': 'blacklist',
+        },
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        },
+        'blacklist': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'blacklist',
+            # Culling would drop live entries; expired ones are removed on lookup
+            'OPTIONS': {'MAX_ENTRIES': 10 ** 9},
+        },
+    }
+
+PASSWORD_HASHERS = [
+    'users.hashers.TunedArgon2PasswordHasher',
+    # Verifies existing hashes; they are upgraded to Argon2id on the next login
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -102,7 +142,7 @@ REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': (
         'rest_framework.renderers.JSONRenderer',
     ),
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    'DEFAULT_PAGINATION_CLASS': 'api.pagination.EstimatedCountPageNumberPagination',
     'PAGE_SIZE': 20,
 }
 
@@ -112,6 +152,7 @@ SIMPLE_JWT = {
     'ALGORITHM': 'HS256',
     'SIGNING_KEY': SECRET_KEY,
     'BLACKLIST_AFTER_ROTATION': True,
+    'TOKEN_REFRESH_SERIALIZER': 'users.serializers.BlacklistCheckedTokenRefreshSerializer',
 }
 
 CORS_ALLOWED_ORIGINS = [
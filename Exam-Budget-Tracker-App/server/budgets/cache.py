@@ -0,0 +1,24 @@
+import time
+
+from django.core.cache import cache
+
+BUDGET_LIST_CACHE_TTL = 300
+
+
+def _version_key(user_id):
+    return f'budgets:{user_id}:version'
+
+
+def budget_list_cache_key(user_id, cursor, fields):
+    """Cache key for one rendered budget list page, scoped to the user's current version
+
+    Built only from the parameters the list reads, so unrelated query params
+    cannot mint new entries.
+    """
+    version = cache.get_or_set(_version_key(user_id), time.time_ns, timeout=None)
+    return f'budgets:{user_id}:{version}:{cursor}:{",".join(fields)}'
+
+
+def invalidate_budget_list_cache(user_id):
+    """Orphan every cached budget list page of the user by moving to a new version"""
+    cache.set(_version_key(user_id), time.time_ns(), timeout=None)
@@ -0,0 +1,29 @@
+import re
+from decimal import Decimal
+
+from rest_framework import serializers
+
+# Plain "12345678" or "12345678.9" / "12345678.90": at most 8 whole digits, 2 places
+_AMOUNT_RE = re.compile(r'^(\d{1,8})(?:\.(\d{1,2}))?$')
+
+
+class CentsField(serializers.DecimalField):
+    """DecimalField(10, 2) that parses well-formed amounts as integer cents
+
+    Matching strings skip Decimal's string parsing, precision check and quantize;
+    anything else (signs, exponents, too many digits, non-strings) goes through
+    DecimalField unchanged, so error messages stay the same.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('max_digits', 10)
+        kwargs.setdefault('decimal_places', 2)
+        super().__init__(**kwargs)
+
+    def to_internal_value(self, data):
+        if isinstance(data, str):
+            m = _AMOUNT_RE.match(data)
+            if m:
+                cents = int(m.group(1)) * 100 + int((m.group(2) or '0').ljust(2, '0'))
+                return Decimal(cents).scaleb(-2)
+        return super().to_internal_value(data)
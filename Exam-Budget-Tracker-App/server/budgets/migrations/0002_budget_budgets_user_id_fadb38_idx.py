@@ -0,0 +1,17 @@
+# Generated by Django 4.2.11 on 2026-10-14 05:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('budgets', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='budget',
+            index=models.Index(fields=['user', '-date', '-created_at', '-id'], name='budgets_user_id_fadb38_idx'),
+        ),
+    ]
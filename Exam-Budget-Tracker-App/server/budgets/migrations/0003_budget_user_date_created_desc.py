@@ -0,0 +1,22 @@
+# Generated by Django 4.2.11 on 2026-10-14 05:28
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('budgets', '0002_budget_budgets_user_id_fadb38_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='budget',
+            name='budgets_user_id_c1e524_idx',
+        ),
+        migrations.RenameIndex(
+            model_name='budget',
+            new_name='budgets_user_date_created_desc',
+            old_name='budgets_user_id_fadb38_idx',
+        ),
+    ]
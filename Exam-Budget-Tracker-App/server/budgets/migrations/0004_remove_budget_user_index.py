@@ -0,0 +1,17 @@
+# Generated by Django 4.2.11 on 2026-10-14 05:28
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('budgets', '0003_budget_user_date_created_desc'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='budget',
+            name='budgets_user_id_300e09_idx',
+        ),
+    ]
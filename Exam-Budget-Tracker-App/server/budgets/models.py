@@ -22,8 +22,8 @@ class Budget(models.Model):
         db_table = 'budgets'
         ordering = ['-date', '-created_at']
         indexes = [
-            models.Index(fields=['user']),
-            models.Index(fields=['user', 'date']),
+            # Matches the list ordering (ordering plus the cursor's id tie-breaker), so no sort step
+            models.Index(fields=['user', '-date', '-created_at', '-id'], name='budgets_user_date_created_desc'),
         ]
 
     def __str__(self):
@@ -0,0 +1,8 @@
+from rest_framework.pagination import CursorPagination
+
+
+class BudgetCursorPagination(CursorPagination):
+    """Keyset pagination over the budget list, seeking on the (user, -date, -created_at, -id) index"""
+
+    ordering = ('-date', '-created_at', '-id')
+    page_size = 25
@@ -1,14 +1,46 @@
+from collections import OrderedDict
+from collections.abc import Mapping
 from decimal import Decimal
+from operator import attrgetter
 
 from django.db.models import Sum
 from rest_framework import serializers
+from rest_framework.relations import PKOnlyObject, RelatedField
 
+from api.serializers import CachedFieldsMixin
+from .fields import CentsField
 from .models import Budget
 
 
-class BudgetSerializer(serializers.ModelSerializer):
+class BudgetBalanceMixin:
+    """Compute `balance` from the queryset annotation, falling back to an aggregate"""
+
+    def get_balance(self, obj):
+        if isinstance(obj, Mapping):
+            initial_amount, total = obj['initial_amount'], obj.get('transactions_total')
+        else:
+            initial_amount = obj.initial_amount
+            total = getattr(obj, 'transactions_total', None)
+            if total is None:
+                total = obj.transactions.aggregate(total=Sum('amount')).get('total')
+        if total is None:
+            total = Decimal('0.00')
+        balance = initial_amount + total
+        return str(balance.quantize(Decimal('0.01')))
+
+
+class BudgetSerializer(CachedFieldsMixin, BudgetBalanceMixin, serializers.ModelSerializer):
+    initial_amount = CentsField(
+        error_messages={
+            'required': 'Initial amount is required.',
+            'invalid': 'Enter a valid decimal number.',
+        }
+    )
     balance = serializers.SerializerMethodField()
 
+    # (field_name, getter) pairs for readable fields, filled in at module load
+    _readable_attrs = ()
+
     class Meta:
         model = Budget
         fields = [
@@ -31,12 +63,6 @@ class BudgetSerializer(serializers.ModelSerializer):
                     'max_length': 'Title must be at most 255 characters.',
                 }
             },
-            'initial_amount': {
-                'error_messages': {
-                    'required': 'Initial amount is required.',
-                    'invalid': 'Enter a valid decimal number.',
-                }
-            },
             'date': {
                 'error_messages': {
                     'required': 'Date is required.',
@@ -45,12 +71,26 @@ class BudgetSerializer(serializers.ModelSerializer):
             },
         }
 
+    def to_representation(self, instance):
+        """Read plain model attributes through precomputed getters"""
+        if not isinstance(instance, Budget):
+            return super().to_representation(instance)
+
+        ret = OrderedDict()
+        fields = self.fields
+        for field_name, getter in self._readable_attrs:
+            field = fields[field_name]
+            attribute = getter(instance) if getter else field.get_attribute(instance)
+            check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+            ret[field_name] = None if check_for_none is None else field.to_representation(attribute)
+        return ret
+
     def validate_title(self, value):
-        if not value or not value.strip():
+        # CharField(max_length=255) has already rejected long titles
+        value = value.strip() if value else ''
+        if not value:
             raise serializers.ValidationError('Title cannot be empty.')
-        if len(value) > 255:
-            raise serializers.ValidationError('Title must be at most 255 characters.')
-        return value.strip()
+        return value
 
     def validate_initial_amount(self, value):
         if value <= 0:
@@ -64,11 +104,36 @@ class BudgetSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError('Date is required.')
         return value
 
-    def get_balance(self, obj):
-        total = getattr(obj, 'transactions_total', None)
-        if total is None:
-            total = obj.transactions.aggregate(total=Sum('amount')).get('total')
-        if total is None:
-            total = Decimal('0.00')
-        balance = obj.initial_amount + total
-        return str(balance.quantize(Decimal('0.01')))
+
+class BudgetReadSerializer(BudgetBalanceMixin, serializers.Serializer):
+    """Explicit read-only Budget representation for the list and retrieve actions
+
+    Accepts model instances as well as the `.values()` rows used by the list action.
+    """
+
+    id = serializers.IntegerField(read_only=True)
+    user = serializers.IntegerField(source='user_id', read_only=True)
+    title = serializers.CharField(read_only=True)
+    description = serializers.SerializerMethodField()
+    date = serializers.DateField(read_only=True)
+    initial_amount = serializers.DecimalField(max_digits=10, decimal_places=2, read_only=True)
+    balance = serializers.SerializerMethodField()
+    created_at = serializers.DateTimeField(read_only=True)
+    updated_at = serializers.DateTimeField(read_only=True)
+
+    def get_description(self, obj):
+        """List rows leave description out unless it was requested"""
+        if isinstance(obj, Mapping):
+            return obj.get('description', '')
+        return obj.description
+
+
+# Relations and method fields keep DRF's own lookup (pk-only optimization, '*' source)
+BudgetSerializer._readable_attrs = tuple(
+    (
+        field.field_name,
+        None if field.source == '*' or isinstance(field, RelatedField) else attrgetter(field.source),
+    )
+    for field in BudgetSerializer().fields.values()
+    if not field.write_only
+)
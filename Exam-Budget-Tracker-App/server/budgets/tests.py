@@ -4,51 +4,72 @@ from rest_framework.test import APIClient
 from rest_framework import status
 from rest_framework_simplejwt.tokens import RefreshToken
 from .models import Budget
+from .throttling import BudgetTokenBucket
 
 User = get_user_model()
 
 
+@pytest.fixture(scope='module')
+def client_pool():
+    """One APIClient per auth state, built once for the module"""
+    return {'anonymous': APIClient(), 'user': APIClient(), 'user_2': APIClient()}
+
+
 @pytest.fixture
-def api_client():
+def api_client(client_pool):
     """Provide unauthenticated API client"""
-    return APIClient()
+    client = client_pool['anonymous']
+    client.credentials()
+    return client
 
 
-@pytest.fixture
-def test_user():
+@pytest.fixture(scope='class')
+def test_user(class_db):
     """Create first test user"""
-    return User.objects.create_user(
-        username='testuser',
-        email='testuser@example.com',
-        password='SecurePass123!'
-    )
+    with class_db.unblock():
+        return User.objects.create_user(
+            username='testuser',
+            email='testuser@example.com',
+            password='SecurePass123!'
+        )
 
 
-@pytest.fixture
-def test_user_2():
+@pytest.fixture(scope='class')
+def test_user_2(class_db):
     """Create second test user for isolation testing"""
-    return User.objects.create_user(
-        username='testuser2',
-        email='testuser2@example.com',
-        password='SecurePass123!'
-    )
+    with class_db.unblock():
+        return User.objects.create_user(
+            username='testuser2',
+            email='testuser2@example.com',
+            password='SecurePass123!'
+        )
+
+
+@pytest.fixture(scope='class')
+def test_user_token(test_user):
+    """Sign test_user's access token once per class"""
+    return str(RefreshToken.for_user(test_user).access_token)
+
+
+@pytest.fixture(scope='class')
+def test_user_2_token(test_user_2):
+    """Sign test_user_2's access token once per class"""
+    return str(RefreshToken.for_user(test_user_2).access_token)
 
 
 @pytest.fixture
-def authenticated_client(test_user):
+def authenticated_client(client_pool, test_user_token):
     """Provide authenticated API client for test_user"""
-    client = APIClient()
-    refresh = RefreshToken.for_user(test_user)
-    client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+    client = client_pool['user']
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {test_user_token}')
     return client
 
 
 @pytest.fixture
-def authenticated_client_2(test_user_2):
+def authenticated_client_2(client_pool, test_user_2_token):
     """Provide authenticated API client for test_user_2"""
-    client = APIClient()
-    refresh = RefreshToken.for_user(test_user_2)
-    client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
+    client = client_pool['user_2']
+    client.credentials(HTTP_AUTHORIZATION=f'Bearer {test_user_2_token}')
     return client
 
 
@@ -78,8 +99,8 @@ def budget_for_user1(test_user):
 @pytest.fixture
 def multiple_budgets(test_user):
     """Create multiple budgets for the same user"""
-    budgets = [
-        Budget.objects.create(
+    return Budget.objects.bulk_create([
+        Budget(
             user=test_user,
             title=f'Budget {i}',
             description=f'Budget {i} description',
@@ -87,8 +108,7 @@ def multiple_budgets(test_user):
             initial_amount=f'{1000*i}.00'
         )
         for i in range(1, 4)
-    ]
-    return budgets
+    ])
 
 
 # ==================== AUTHENTICATION TESTS ====================
@@ -122,6 +142,20 @@ class TestBudgetAuthentication:
         response = api_client.delete(f'/api/budgets/{budget_for_user1.id}/')
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
+    def test_inactive_user_token_returns_401(self, authenticated_client, test_user, valid_budget_data):
+        """Test a deactivated user's token can neither list nor create budgets"""
+        User.objects.filter(pk=test_user.pk).update(is_active=False)
+
+        assert authenticated_client.get('/api/budgets/').status_code == status.HTTP_401_UNAUTHORIZED
+        assert authenticated_client.post('/api/budgets/', valid_budget_data).status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_deleted_user_token_returns_401(self, authenticated_client, test_user, valid_budget_data):
+        """Test a deleted user's token can neither list nor create budgets"""
+        User.objects.filter(pk=test_user.pk).delete()
+
+        assert authenticated_client.get('/api/budgets/').status_code == status.HTTP_401_UNAUTHORIZED
+        assert authenticated_client.post('/api/budgets/', valid_budget_data).status_code == status.HTTP_401_UNAUTHORIZED
+
 
 # ==================== CREATE TESTS ====================
 
@@ -191,170 +225,38 @@ class TestBudgetCreation:
 class TestBudgetValidation:
     """Test input validation for budgets"""
 
-    def test_create_budget_missing_title_returns_400(self, authenticated_client):
-        """Test creating budget without title fails"""
-        data = {
-            'description': 'No title budget',
-            'date': '2026-02-15',
-            'initial_amount': '5000.00',
-        }
-        response = authenticated_client.post('/api/budgets/', data)
-        
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert 'title' in response.data
-
-    def test_create_budget_empty_title_returns_400(self, authenticated_client):
-        """Test creating budget with empty title fails"""
-        data = {
-            'title': '',
-            'description': 'Empty title budget',
-            'date': '2026-02-15',
-            'initial_amount': '5000.00',
-        }
-        response = authenticated_client.post('/api/budgets/', data)
-        
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert 'title' in response.data
-
-    def test_create_budget_whitespace_title_returns_400(self, authenticated_client):
-        """Test creating budget with whitespace-only title fails"""
-        data = {
-            'title': '   ',
-            'description': 'Whitespace title budget',
-            'date': '2026-02-15',
-            'initial_amount': '5000.00',
-        }
-        response = authenticated_client.post('/api/budgets/', data)
-        
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert 'title' in response.data
-
-    def test_create_budget_title_too_long_returns_400(self, authenticated_client):
-        """Test creating budget with title > 255 chars fails"""
-        data = {
-            'title': 'A' * 256,
-            'description': 'Too long title',
-            'date': '2026-02-15',
-            'initial_amount': '5000.00',
-        }
-        response = authenticated_client.post('/api/budgets/', data)
-        
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert 'title' in response.data
-
-    def test_create_budget_negative_amount_returns_400(self, authenticated_client):
-        """Test creating budget with negative amount fails"""
-        data = {
-            'title': 'Negative Budget',
-            'description': 'Negative amount',
-            'date': '2026-02-15',
-            'initial_amount': '-5000.00',
-        }
-        response = authenticated_client.post('/api/budgets/', data)
-        
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert 'initial_amount' in response.data
-
-    def test_create_budget_zero_amount_returns_400(self, authenticated_client):
-        """Test creating budget with zero amount fails"""
-        data = {
-            'title': 'Zero Budget',
-            'description': 'Zero amount',
-            'date': '2026-02-15',
-            'initial_amount': '0.00',
-        }
-        response = authenticated_client.post('/api/budgets/', data)
-        
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert 'initial_amount' in response.data
+    @pytest.mark.parametrize('payload,field', [
+        pytest.param({'date': '2026-02-15', 'initial_amount': '5000.00'}, 'title', id='missing_title'),
+        pytest.param({'title': '', 'date': '2026-02-15', 'initial_amount': '5000.00'}, 'title', id='empty_title'),
+        pytest.param({'title': '   ', 'date': '2026-02-15', 'initial_amount': '5000.00'}, 'title', id='whitespace_title'),
+        pytest.param({'title': 'A' * 256, 'date': '2026-02-15', 'initial_amount': '5000.00'}, 'title', id='title_too_long'),
+        pytest.param({'title': 'Budget', 'date': '2026-02-15', 'initial_amount': '-5000.00'}, 'initial_amount', id='negative_amount'),
+        pytest.param({'title': 'Budget', 'date': '2026-02-15', 'initial_amount': '0.00'}, 'initial_amount', id='zero_amount'),
+        pytest.param({'title': 'Budget', 'date': '2026-02-15'}, 'initial_amount', id='missing_amount'),
+        pytest.param({'title': 'Budget', 'date': '2026-02-15', 'initial_amount': 'not_a_number'}, 'initial_amount', id='invalid_amount_format'),
+        pytest.param({'title': 'Budget', 'date': '2026-02-15', 'initial_amount': '5000.505'}, 'initial_amount', id='three_decimal_places'),
+        pytest.param({'title': 'Budget', 'initial_amount': '5000.00'}, 'date', id='missing_date'),
+        pytest.param({'title': 'Budget', 'date': '15-02-2026', 'initial_amount': '5000.00'}, 'date', id='invalid_date_format'),
+    ])
+    def test_create_budget_invalid_payload_returns_400(self, authenticated_client, payload, field):
+        """Test creating budget with an invalid field fails on that field"""
+        response = authenticated_client.post('/api/budgets/', payload)
 
-    def test_create_budget_missing_amount_returns_400(self, authenticated_client):
-        """Test creating budget without amount fails"""
-        data = {
-            'title': 'Missing Amount',
-            'description': 'No amount',
-            'date': '2026-02-15',
-        }
-        response = authenticated_client.post('/api/budgets/', data)
-        
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert 'initial_amount' in response.data
+        assert field in response.data
+
+    @pytest.mark.parametrize('payload,field,expected', [
+        pytest.param({'title': 'No Description', 'date': '2026-02-15', 'initial_amount': '5000.00'}, 'description', '', id='optional_description'),
+        pytest.param({'title': 'Short Amount', 'date': '2026-02-15', 'initial_amount': '5000.5'}, 'initial_amount', '5000.50', id='one_decimal_place_normalized'),
+        pytest.param({'title': 'Past Budget', 'date': '2020-01-01', 'initial_amount': '5000.00'}, 'date', '2020-01-01', id='past_date_allowed'),
+        pytest.param({'title': 'Future Budget', 'date': '2030-12-31', 'initial_amount': '5000.00'}, 'date', '2030-12-31', id='future_date_allowed'),
+    ])
+    def test_create_budget_valid_payload_returns_201(self, authenticated_client, payload, field, expected):
+        """Test edge-case payloads are accepted and echoed back as stored"""
+        response = authenticated_client.post('/api/budgets/', payload)
 
-    def test_create_budget_invalid_amount_format_returns_400(self, authenticated_client):
-        """Test creating budget with invalid amount format fails"""
-        data = {
-            'title': 'Invalid Amount',
-            'description': 'Invalid format',
-            'date': '2026-02-15',
-            'initial_amount': 'not_a_number',
-        }
-        response = authenticated_client.post('/api/budgets/', data)
-        
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert 'initial_amount' in response.data
-
-    def test_create_budget_missing_date_returns_400(self, authenticated_client):
-        """Test creating budget without date fails"""
-        data = {
-            'title': 'Missing Date',
-            'description': 'No date',
-            'initial_amount': '5000.00',
-        }
-        response = authenticated_client.post('/api/budgets/', data)
-        
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert 'date' in response.data
-
-    def test_create_budget_invalid_date_format_returns_400(self, authenticated_client):
-        """Test creating budget with invalid date format fails"""
-        data = {
-            'title': 'Invalid Date',
-            'description': 'Bad date',
-            'date': '15-02-2026',
-            'initial_amount': '5000.00',
-        }
-        response = authenticated_client.post('/api/budgets/', data)
-        
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert 'date' in response.data
-
-    def test_create_budget_optional_description(self, authenticated_client):
-        """Test description is optional"""
-        data = {
-            'title': 'No Description',
-            'date': '2026-02-15',
-            'initial_amount': '5000.00',
-        }
-        response = authenticated_client.post('/api/budgets/', data)
-        
         assert response.status_code == status.HTTP_201_CREATED
-        assert response.data['description'] == ''
-
-    def test_create_budget_past_date_allowed(self, authenticated_client):
-        """Test budget can be created with past date"""
-        data = {
-            'title': 'Past Budget',
-            'description': 'Past date budget',
-            'date': '2020-01-01',
-            'initial_amount': '5000.00',
-        }
-        response = authenticated_client.post('/api/budgets/', data)
-        
-        assert response.status_code == status.HTTP_201_CREATED
-        assert response.data['date'] == '2020-01-01'
-
-    def test_create_budget_future_date_allowed(self, authenticated_client):
-        """Test budget can be created with future date"""
-        data = {
-            'title': 'Future Budget',
-            'description': 'Future date budget',
-            'date': '2030-12-31',
-            'initial_amount': '5000.00',
-        }
-        response = authenticated_client.post('/api/budgets/', data)
-        
-        assert response.status_code == status.HTTP_201_CREATED
-        assert response.data['date'] == '2030-12-31'
+        assert response.data[field] == expected
 
 
 # ==================== READ TESTS ====================
@@ -368,19 +270,62 @@ class TestBudgetRetrieval:
         response = authenticated_client.get('/api/budgets/')
         
         assert response.status_code == status.HTTP_200_OK
-        assert response.data['count'] == 3
         assert len(response.data['results']) == 3
 
+    def test_list_budgets_returns_full_representation(self, authenticated_client, test_user, budget_for_user1):
+        """Test list rows carry the same fields as the detail endpoint when description is requested"""
+        response = authenticated_client.get('/api/budgets/?fields=description')
+
+        assert response.status_code == status.HTTP_200_OK
+        budget = response.data['results'][0]
+        assert budget['id'] == budget_for_user1.id
+        assert budget['user'] == test_user.id
+        assert budget['description'] == 'Already created budget'
+        assert budget['date'] == '2026-01-01'
+        assert budget['initial_amount'] == '3000.00'
+        assert budget['balance'] == '3000.00'
+        assert budget['created_at'] is not None
+
+    def test_list_budgets_omits_description_by_default(self, authenticated_client, budget_for_user1, django_assert_num_queries):
+        """Test the description column is only selected when requested"""
+        with django_assert_num_queries(2) as captured:
+            response = authenticated_client.get('/api/budgets/')
+
+        assert response.data['results'][0]['description'] == ''
+        select_clause = captured.captured_queries[-1]['sql'].split(' FROM ')[0]
+        assert 'description' not in select_clause
+
     def test_list_budgets_pagination(self, authenticated_client, test_user, multiple_budgets):
         """Test pagination works for budget list"""
-        response = authenticated_client.get('/api/budgets/?page=1')
+        response = authenticated_client.get('/api/budgets/')
         
         assert response.status_code == status.HTTP_200_OK
-        assert 'count' in response.data
         assert 'next' in response.data
         assert 'previous' in response.data
         assert 'results' in response.data
 
+    def test_list_budgets_cursor_walks_all_pages_in_order(self, authenticated_client, test_user):
+        """Test following the cursor returns every budget once, newest date first"""
+        Budget.objects.bulk_create([
+            Budget(user=test_user, title=f'Budget {i}', date=f'2026-01-{i:02d}', initial_amount='100.00')
+            for i in range(1, 31)
+        ])
+
+        first_page = authenticated_client.get('/api/budgets/')
+        assert first_page.status_code == status.HTTP_200_OK
+        assert len(first_page.data['results']) == 25
+        assert first_page.data['previous'] is None
+        assert first_page.data['next'] is not None
+
+        second_page = authenticated_client.get(first_page.data['next'])
+        assert second_page.status_code == status.HTTP_200_OK
+        assert len(second_page.data['results']) == 5
+        assert second_page.data['next'] is None
+
+        dates = [b['date'] for b in first_page.data['results'] + second_page.data['results']]
+        assert dates == sorted(dates, reverse=True)
+        assert len(set(dates)) == 30
+
     def test_retrieve_own_budget_returns_200(self, authenticated_client, budget_for_user1):
         """Test user can retrieve their own budget"""
         response = authenticated_client.get(f'/api/budgets/{budget_for_user1.id}/')
@@ -400,7 +345,6 @@ class TestBudgetRetrieval:
         response = authenticated_client.get('/api/budgets/')
         
         assert response.status_code == status.HTTP_200_OK
-        assert response.data['count'] == 0
         assert len(response.data['results']) == 0
 
 
@@ -454,7 +398,7 @@ class TestBudgetUserIsolation:
         response = authenticated_client.get('/api/budgets/')
         
         assert response.status_code == status.HTTP_200_OK
-        assert response.data['count'] == 1
+        assert len(response.data['results']) == 1
         assert response.data['results'][0]['title'] == 'User 1 Budget'
         
         # Verify user 2's budget is not in response
@@ -462,6 +406,137 @@ class TestBudgetUserIsolation:
         assert 'User 2 Budget' not in titles
 
 
+# ==================== LIST CACHE TESTS ====================
+
+@pytest.mark.django_db
+class TestBudgetListCache:
+    """Test caching of the rendered budget list"""
+
+    def test_list_is_served_from_cache(self, authenticated_client, test_user, budget_for_user1):
+        """Test repeated list requests reuse the cached page"""
+        authenticated_client.get('/api/budgets/')
+        Budget.objects.create(user=test_user, title='Out Of Band', date='2026-03-01', initial_amount='10.00')
+
+        response = authenticated_client.get('/api/budgets/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [b['title'] for b in response.data['results']] == ['Existing Budget']
+
+    def test_create_invalidates_cached_list(self, authenticated_client, valid_budget_data):
+        """Test a new budget shows up in the next list response"""
+        assert authenticated_client.get('/api/budgets/').data['results'] == []
+
+        authenticated_client.post('/api/budgets/', valid_budget_data)
+        response = authenticated_client.get('/api/budgets/')
+
+        assert [b['title'] for b in response.data['results']] == ['Monthly Budget']
+
+    def test_update_invalidates_cached_list(self, authenticated_client, budget_for_user1):
+        """Test an updated budget is reflected in the next list response"""
+        authenticated_client.get('/api/budgets/')
+
+        authenticated_client.patch(f'/api/budgets/{budget_for_user1.id}/', {'title': 'Renamed'})
+        response = authenticated_client.get('/api/budgets/')
+
+        assert response.data['results'][0]['title'] == 'Renamed'
+
+    def test_delete_invalidates_cached_list(self, authenticated_client, budget_for_user1):
+        """Test a deleted budget disappears from the next list response"""
+        authenticated_client.get('/api/budgets/')
+
+        authenticated_client.delete(f'/api/budgets/{budget_for_user1.id}/')
+        response = authenticated_client.get('/api/budgets/')
+
+        assert response.data['results'] == []
+
+    def test_unused_query_params_share_one_cache_entry(self, authenticated_client, test_user, budget_for_user1):
+        """Test junk query params neither bypass the cache nor add entries"""
+        authenticated_client.get('/api/budgets/')
+        Budget.objects.create(user=test_user, title='Out Of Band', date='2026-03-01', initial_amount='10.00')
+
+        response = authenticated_client.get('/api/budgets/?x=1&fields=bogus')
+
+        assert [b['title'] for b in response.data['results']] == ['Existing Budget']
+
+    def test_fields_param_gets_its_own_cache_entry(self, authenticated_client, budget_for_user1):
+        """Test a page cached without description is not served for ?fields=description"""
+        authenticated_client.get('/api/budgets/')
+
+        response = authenticated_client.get('/api/budgets/?fields=description')
+
+        assert response.data['results'][0]['description'] == budget_for_user1.description
+
+    def test_cache_is_scoped_per_user(self, authenticated_client, authenticated_client_2, budget_for_user1):
+        """Test one user's cached list is never served to another user"""
+        authenticated_client.get('/api/budgets/')
+
+        response = authenticated_client_2.get('/api/budgets/')
+
+        assert response.data['results'] == []
+
+
+# ==================== THROTTLING TESTS ====================
+
+@pytest.mark.django_db
+class TestBudgetWriteThrottle:
+    """Test the per-user token bucket on budget writes"""
+
+    @pytest.fixture(autouse=True)
+    def clock(self, monkeypatch):
+        """Pin the bucket clock so slow requests never refill tokens mid-test"""
+        now = [1000.0]
+        monkeypatch.setattr('budgets.throttling.monotonic', lambda: now[0])
+        return now
+
+    def test_burst_beyond_capacity_returns_429(self, authenticated_client, valid_budget_data):
+        """Test writes past the bucket capacity are rejected"""
+        for _ in range(20):
+            response = authenticated_client.post('/api/budgets/', valid_budget_data)
+            assert response.status_code == status.HTTP_201_CREATED
+
+        response = authenticated_client.post('/api/budgets/', valid_budget_data)
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert 'Retry-After' in response
+
+    def test_reads_are_not_throttled(self, authenticated_client, valid_budget_data):
+        """Test list requests keep working once the write bucket is empty"""
+        for _ in range(21):
+            authenticated_client.post('/api/budgets/', valid_budget_data)
+
+        response = authenticated_client.get('/api/budgets/')
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_bucket_is_per_user(self, authenticated_client, authenticated_client_2, valid_budget_data):
+        """Test one user draining their bucket does not affect another user"""
+        for _ in range(21):
+            authenticated_client.post('/api/budgets/', valid_budget_data)
+
+        response = authenticated_client_2.post('/api/budgets/', valid_budget_data)
+
+        assert response.status_code == status.HTTP_201_CREATED
+
+    def test_idle_bucket_is_evicted_once_full(self, clock, authenticated_client, test_user, valid_budget_data):
+        """Test a bucket is dropped after the time it takes to refill completely"""
+        authenticated_client.post('/api/budgets/', valid_budget_data)
+        assert test_user.pk in BudgetTokenBucket.buckets
+
+        clock[0] += BudgetTokenBucket.capacity / BudgetTokenBucket.rate
+
+        assert test_user.pk not in BudgetTokenBucket.buckets
+
+    def test_bucket_refills_with_time(self, clock, authenticated_client, valid_budget_data):
+        """Test a drained bucket accepts a write again once a token has refilled"""
+        for _ in range(21):
+            authenticated_client.post('/api/budgets/', valid_budget_data)
+
+        clock[0] += 1 / BudgetTokenBucket.rate
+        response = authenticated_client.post('/api/budgets/', valid_budget_data)
+
+        assert response.status_code == status.HTTP_201_CREATED
+
+
 # ==================== UPDATE TESTS ====================
 
 @pytest.mark.django_db
@@ -539,8 +614,27 @@ class TestBudgetDeletion:
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not Budget.objects.filter(id=budget_id).exists()
 
+    def test_delete_other_user_budget_fetches_no_aggregate(self, authenticated_client_2, budget_for_user1, django_assert_num_queries):
+        """Test the 404 lookup of a delete is a single plain row query after the user lookup"""
+        with django_assert_num_queries(2) as captured:
+            response = authenticated_client_2.delete(f'/api/budgets/{budget_for_user1.id}/')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert 'SUM(' not in captured.captured_queries[-1]['sql'].upper()
+
     def test_delete_nonexistent_budget_returns_404(self, authenticated_client):
         """Test deleting nonexistent budget returns 404"""
         response = authenticated_client.delete('/api/budgets/99999/')
         
         assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+# ==================== TEST ISOLATION ====================
+
+class TestClassDbBlocking:
+    """Test class-scoped DB fixtures do not open the database to unmarked tests"""
+
+    def test_unmarked_test_cannot_query(self, test_user):
+        """Test a test without django_db is still blocked once the class transaction exists"""
+        with pytest.raises(RuntimeError, match='Database access not allowed'):
+            Budget.objects.count()
@@ -0,0 +1,43 @@
+import threading
+from time import monotonic
+
+from cachetools import TTLCache
+from rest_framework.throttling import BaseThrottle
+
+
+class BudgetTokenBucket(BaseThrottle):
+    """In-memory per-user token bucket for budget writes; reads are never throttled"""
+
+    capacity = 20
+    rate = 1.0  # tokens refilled per second
+
+    # user pk -> (tokens, last_refill). An entry idle for capacity / rate seconds
+    # would be full again anyway, so it expires instead of piling up per user.
+    # Clock looked up per call so tests can pin budgets.throttling.monotonic
+    buckets = TTLCache(maxsize=8192, ttl=capacity / rate, timer=lambda: monotonic())
+    lock = threading.Lock()
+
+    def allow_request(self, request, view):
+        if request.method in ('GET', 'HEAD', 'OPTIONS'):
+            return True
+
+        now = monotonic()
+        key = request.user.pk
+        with self.lock:
+            tokens, last_refill = self.buckets.get(key, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - last_refill) * self.rate)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self.buckets[key] = (tokens, now)
+        self.tokens = tokens
+        return allowed
+
+    def wait(self):
+        """Seconds until the next token is available"""
+        return (1 - self.tokens) / self.rate
+
+    @classmethod
+    def reset(cls):
+        with cls.lock:
+            cls.buckets.clear()
@@ -1,31 +1,86 @@
+from django.core.cache import cache
 from django.db.models import DecimalField, Sum, Value
 from django.db.models.functions import Coalesce
 from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 
 from api.permissions import IsOwner
+from .cache import BUDGET_LIST_CACHE_TTL, budget_list_cache_key, invalidate_budget_list_cache
 from .models import Budget
-from .serializers import BudgetSerializer
+from .pagination import BudgetCursorPagination
+from .serializers import BudgetReadSerializer, BudgetSerializer
+from .throttling import BudgetTokenBucket
+
+LIST_FIELDS = (
+    'id',
+    'user_id',
+    'title',
+    'date',
+    'initial_amount',
+    'created_at',
+    'updated_at',
+)
+# Selected on the list only when asked for with ?fields=
+OPTIONAL_LIST_FIELDS = ('description',)
 
 
 class BudgetViewSet(viewsets.ModelViewSet):
     serializer_class = BudgetSerializer
     permission_classes = [IsAuthenticated, IsOwner]
+    pagination_class = BudgetCursorPagination
+    throttle_classes = [BudgetTokenBucket]
 
     def get_queryset(self):
         """Return only authenticated user's budgets"""
-        return Budget.objects.filter(user=self.request.user).annotate(
+        queryset = Budget.objects.filter(user_id=self.request.user.pk)
+        if self.action == 'destroy':
+            # Nothing is serialized, so skip the transactions join and GROUP BY
+            return queryset
+        queryset = queryset.annotate(
             transactions_total=Coalesce(
                 Sum('transactions__amount'),
                 Value(0),
                 output_field=DecimalField(max_digits=12, decimal_places=2),
             )
         )
+        if self.action == 'list':
+            # List rows go straight to BudgetReadSerializer, no model instances needed
+            return queryset.values(*LIST_FIELDS, *self.optional_list_fields(), 'transactions_total')
+        return queryset
+
+    def optional_list_fields(self):
+        """OPTIONAL_LIST_FIELDS asked for with ?fields=, in their declared order"""
+        requested = self.request.query_params.get('fields', '').split(',')
+        return [name for name in OPTIONAL_LIST_FIELDS if name in requested]
+
+    def get_serializer_class(self):
+        """Use the lightweight read serializer for list and retrieve"""
+        if self.action in ('list', 'retrieve'):
+            return BudgetReadSerializer
+        return BudgetSerializer
+
+    def list(self, request, *args, **kwargs):
+        """Serve the user's rendered budget list page from cache when available"""
+        cursor = request.query_params.get(self.paginator.cursor_query_param, '')
+        key = budget_list_cache_key(request.user.pk, cursor, self.optional_list_fields())
+        data = cache.get(key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(key, data, BUDGET_LIST_CACHE_TTL)
+        return Response(data)
 
     def perform_create(self, serializer):
         """Auto-set user to authenticated user"""
-        serializer.save(user=self.request.user)
+        serializer.save(user_id=self.request.user.pk)
+        invalidate_budget_list_cache(self.request.user.pk)
 
     def perform_update(self, serializer):
         """Ensure user cannot change budget ownership"""
-        serializer.save(user=self.request.user)
+        serializer.save(user_id=self.request.user.pk)
+        invalidate_budget_list_cache(self.request.user.pk)
+
+    def perform_destroy(self, instance):
+        """Drop cached list pages once the budget is gone"""
+        instance.delete()
+        invalidate_budget_list_cache(self.request.user.pk)
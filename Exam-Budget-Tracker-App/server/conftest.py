@@ -1,8 +1,69 @@
 import os
 import django
+import pytest
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'api.settings')
 django.setup()
 
 from django.test.utils import get_runner
 from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.test import override_settings
+
+from budgets.throttling import BudgetTokenBucket
+from users.blacklist import clear_local_cache
+
+
+@pytest.fixture(scope='session', autouse=True)
+def _fast_hasher():
+    """Hash test passwords with MD5; the production Argon2 cost is pure overhead here"""
+    with override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher']):
+        yield
+
+
+@pytest.fixture(scope='session', autouse=True)
+def _local_cache():
+    """Keep tests off the configured Redis; clearing it would drop the real token blacklist"""
+    with override_settings(CACHES={
+        'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'},
+        'blacklist': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'blacklist',
+            'OPTIONS': {'MAX_ENTRIES': 10 ** 9},
+        },
+    }):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Keep cached responses from leaking between tests"""
+    for alias_cache in caches.all():
+        alias_cache.clear()
+    clear_local_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_throttles():
+    """Give every test a full write allowance"""
+    BudgetTokenBucket.reset()
+
+
+@pytest.fixture(scope='class')
+def class_db(django_db_setup, django_db_blocker):
+    """Class-wide transaction for class-scoped fixtures; each test still rolls back to its own savepoint
+
+    The database is only unblocked to open and roll back the outer transaction, so
+    a test without the django_db mark still gets no access. Yields the blocker:
+    class-scoped fixtures write under `with class_db.unblock():`.
+    """
+    with django_db_blocker.unblock():
+        atomic = transaction.atomic()
+        atomic.__enter__()
+    try:
+        yield django_db_blocker
+    finally:
+        with django_db_blocker.unblock():
+            transaction.set_rollback(True)
+            atomic.__exit__(None, None, None)
@@ -0,0 +1,16 @@
+# Generated by Django 4.2.11 on 2026-10-14 05:26
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('health_check', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.DeleteModel(
+            name='HealthCheck',
+        ),
+    ]
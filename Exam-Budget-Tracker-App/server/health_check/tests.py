@@ -8,8 +8,9 @@ def api_client():
     return APIClient()
 
 
-@pytest.mark.django_db
 class TestHealthCheck:
+    """No django_db mark: any database access from /up fails the test"""
+
     def test_health_check_endpoint_returns_ok_status(self, api_client):
         """Test that GET /up returns status 200 with ok response"""
         response = api_client.get('/up')
@@ -26,3 +27,9 @@ class TestHealthCheck:
         response = api_client.get('/up')
         assert 'status' in response.data
         assert isinstance(response.data['status'], str)
+
+    def test_health_check_ignores_authorization_header(self, api_client):
+        """Test that /up skips authentication even when a token is sent"""
+        api_client.credentials(HTTP_AUTHORIZATION='Bearer not.a.token')
+        response = api_client.get('/up')
+        assert response.status_code == 200
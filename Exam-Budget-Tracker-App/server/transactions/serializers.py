@@ -54,7 +54,7 @@ class TransactionSerializer(serializers.ModelSerializer):
         request = self.context.get('request')
         if not request or not request.user or not request.user.is_authenticated:
             raise serializers.ValidationError('Authenticated user is required.')
-        if value.user != request.user:
+        if value.user_id != request.user.pk:
             raise serializers.ValidationError('Category does not belong to the authenticated user.')
         return value
 
@@ -73,6 +73,6 @@ class TransactionSerializer(serializers.ModelSerializer):
         request = self.context.get('request')
         if not request or not request.user or not request.user.is_authenticated:
             raise serializers.ValidationError('Authenticated user is required.')
-        if value.user != request.user:
+        if value.user_id != request.user.pk:
             raise serializers.ValidationError('Budget does not belong to the authenticated user.')
         return value
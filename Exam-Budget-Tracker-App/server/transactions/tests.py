@@ -1,9 +1,12 @@
 import pytest
 from django.contrib.auth import get_user_model
+from django.db import connection
 from rest_framework.test import APIClient
 from rest_framework import status
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from api import pagination
+from api.pagination import EstimatedCountPageNumberPagination, EstimatedCountPaginator
 from budgets.models import Budget
 from categories.models import Category
 from .models import Transaction
@@ -370,6 +373,115 @@ class TestTransactionRetrieval:
         assert 'previous' in response.data
         assert 'results' in response.data
 
+    def test_list_transactions_count_past_exact_limit_is_estimated(
+        self, monkeypatch, authenticated_client, budget_for_user1, category_for_user1
+    ):
+        monkeypatch.setattr(EstimatedCountPaginator, 'exact_count_limit', 2)
+        monkeypatch.setattr(EstimatedCountPaginator, '_estimate', lambda self, queryset: 40)
+        Transaction.objects.bulk_create([
+            Transaction(budget=budget_for_user1, amount=f'{index}.00', category=category_for_user1, date=f'2026-02-0{index}')
+            for index in range(1, 5)
+        ])
+
+        response = authenticated_client.get('/api/transactions/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == 40
+
+    def test_list_transactions_underestimated_count_still_reaches_every_page(
+        self, monkeypatch, authenticated_client, budget_for_user1, category_for_user1
+    ):
+        monkeypatch.setattr(EstimatedCountPaginator, 'exact_count_limit', 2)
+        monkeypatch.setattr(EstimatedCountPaginator, '_estimate', lambda self, queryset: 1)
+        monkeypatch.setattr(EstimatedCountPageNumberPagination, 'page_size', 2)
+        Transaction.objects.bulk_create([
+            Transaction(budget=budget_for_user1, amount=f'{index}.00', category=category_for_user1, date=f'2026-02-0{index}')
+            for index in range(1, 8)
+        ])
+
+        seen = []
+        url = '/api/transactions/'
+        while url:
+            response = authenticated_client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+            assert response.data['count'] == 3
+            seen.extend(item['id'] for item in response.data['results'])
+            url = response.data['next']
+
+        assert sorted(seen) == sorted(Transaction.objects.values_list('id', flat=True))
+        assert authenticated_client.get('/api/transactions/?page=5').status_code == status.HTTP_404_NOT_FOUND
+        last_page = authenticated_client.get('/api/transactions/?page=last')
+        assert last_page.status_code == status.HTTP_200_OK
+        assert len(last_page.data['results']) == 1
+        assert last_page.data['next'] is None
+
+    def test_list_transactions_overestimated_count_ends_at_the_real_rows(
+        self, monkeypatch, authenticated_client, budget_for_user1, category_for_user1
+    ):
+        monkeypatch.setattr(EstimatedCountPaginator, 'exact_count_limit', 2)
+        monkeypatch.setattr(EstimatedCountPaginator, '_estimate', lambda self, queryset: 40)
+        monkeypatch.setattr(EstimatedCountPageNumberPagination, 'page_size', 2)
+        Transaction.objects.bulk_create([
+            Transaction(budget=budget_for_user1, amount=f'{index}.00', category=category_for_user1, date=f'2026-02-0{index}')
+            for index in range(1, 6)
+        ])
+
+        third_page = authenticated_client.get('/api/transactions/?page=3')
+        assert third_page.status_code == status.HTTP_200_OK
+        assert third_page.data['count'] == 40
+        assert len(third_page.data['results']) == 1
+        assert third_page.data['next'] is None
+
+        assert authenticated_client.get('/api/transactions/?page=4').status_code == status.HTTP_404_NOT_FOUND
+        assert authenticated_client.get('/api/transactions/?page=20').status_code == status.HTTP_404_NOT_FOUND
+        last_page = authenticated_client.get('/api/transactions/?page=last')
+        assert last_page.status_code == status.HTTP_200_OK
+        assert last_page.data['results'] == third_page.data['results']
+
+    @pytest.mark.skipif(connection.vendor == 'postgresql', reason='Postgres estimates from EXPLAIN')
+    def test_estimate_falls_back_to_exact_count(self, budget_for_user1, category_for_user1):
+        Transaction.objects.bulk_create([
+            Transaction(budget=budget_for_user1, amount=f'{index}.00', category=category_for_user1, date=f'2026-02-0{index}')
+            for index in range(1, 5)
+        ])
+        queryset = Transaction.objects.all()
+
+        assert EstimatedCountPaginator(queryset, 2)._estimate(queryset) == 4
+
+    def test_estimate_reads_plan_rows_from_postgres_explain(self, monkeypatch):
+        executed = []
+
+        class FakeCursor:
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return False
+
+            def execute(self, sql, params):
+                executed.append(sql)
+
+            def fetchone(self):
+                return ('[{"Plan": {"Plan Rows": 123456}}]',)
+
+        class FakeConnection:
+            vendor = 'postgresql'
+
+            def cursor(self):
+                return FakeCursor()
+
+        monkeypatch.setattr(pagination, 'connections', {'default': FakeConnection()})
+        queryset = Transaction.objects.all()
+
+        assert EstimatedCountPaginator(queryset, 2)._estimate(queryset) == 123456
+        assert executed[0].startswith('EXPLAIN (FORMAT JSON) SELECT')
+
+    @pytest.mark.skipif(connection.vendor != 'postgresql', reason='EXPLAIN (FORMAT JSON) is Postgres only')
+    def test_estimate_runs_explain_on_postgres(self):
+        queryset = Transaction.objects.all()
+
+        assert EstimatedCountPaginator(queryset, 2)._estimate(queryset) >= 0
+
     def test_retrieve_own_transaction_returns_200(self, authenticated_client, transaction_for_user1):
         response = authenticated_client.get(f'/api/transactions/{transaction_for_user1.id}/')
 
@@ -519,3 +631,18 @@ class TestBudgetBalance:
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data['balance'] == '1000.00'
+
+    def test_budget_list_balance_refreshes_after_transaction_write(
+        self, authenticated_client, budget_for_user1
+    ):
+        authenticated_client.get('/api/budgets/')
+
+        authenticated_client.post('/api/transactions/', {
+            'budget': budget_for_user1.id,
+            'amount': '-250.00',
+            'date': '2026-02-10',
+        })
+        response = authenticated_client.get('/api/budgets/')
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['results'][0]['balance'] == '750.00'
@@ -2,6 +2,7 @@ from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
 
 from api.permissions import IsOwner
+from budgets.cache import invalidate_budget_list_cache
 from .models import Transaction
 from .serializers import TransactionSerializer
 
@@ -12,8 +13,21 @@ class TransactionViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         """Return only authenticated user's transactions"""
-        queryset = Transaction.objects.filter(budget__user=self.request.user).select_related('budget', 'category')
+        queryset = Transaction.objects.filter(budget__user_id=self.request.user.pk).select_related('budget', 'category')
         budget_id = self.request.query_params.get('budget')
         if budget_id:
             queryset = queryset.filter(budget_id=budget_id)
         return queryset
+
+    # Budget list pages embed each budget's balance, so transaction writes invalidate them too
+    def perform_create(self, serializer):
+        serializer.save()
+        invalidate_budget_list_cache(self.request.user.pk)
+
+    def perform_update(self, serializer):
+        serializer.save()
+        invalidate_budget_list_cache(self.request.user.pk)
+
+    def perform_destroy(self, instance):
+        instance.delete()
+        invalidate_budget_list_cache(self.request.user.pk)
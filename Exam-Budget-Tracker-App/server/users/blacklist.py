@@ -0,0 +1,43 @@
+import threading
+import time
+
+from cachetools import TTLCache
+from django.core.cache import caches
+from rest_framework_simplejwt.settings import api_settings
+
+# Per-process memo of blacklist lookups (hits and misses) in front of the shared,
+# non-evicting 'blacklist' cache. A logout handled by another worker is seen here
+# within LOCAL_TTL seconds.
+LOCAL_TTL = 60
+_local = TTLCache(maxsize=8192, ttl=LOCAL_TTL)
+_local_lock = threading.Lock()
+
+
+def _cache_key(jti):
+    return f'bl:{jti}'
+
+
+def blacklist_token(token):
+    """Blacklist a refresh token (or its decoded claims) by jti until it would expire anyway"""
+    jti = token[api_settings.JTI_CLAIM]
+    ttl = max(int(token['exp'] - time.time()), 1)
+    caches['blacklist'].set(_cache_key(jti), 1, timeout=ttl)
+    with _local_lock:
+        _local[jti] = True
+
+
+def is_blacklisted(jti):
+    """In-process lookup first, then one O(1) shared cache lookup"""
+    with _local_lock:
+        hit = _local.get(jti)
+    if hit is not None:
+        return hit
+    result = caches['blacklist'].has_key(_cache_key(jti))
+    with _local_lock:
+        _local[jti] = result
+    return result
+
+
+def clear_local_cache():
+    with _local_lock:
+        _local.clear()
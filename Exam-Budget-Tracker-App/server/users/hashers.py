@@ -0,0 +1,13 @@
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    """Argon2id with the OWASP minimum profile: 46 MiB, 1 pass, 1 lane
+
+    Keeps the `argon2` algorithm name, so hashes made with other parameters are
+    still verified and get rehashed on the next login.
+    """
+
+    time_cost = 1
+    memory_cost = 47104  # KiB
+    parallelism = 1
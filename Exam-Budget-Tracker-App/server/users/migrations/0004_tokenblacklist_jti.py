@@ -0,0 +1,40 @@
+# Generated by Django 4.2.11 on 2026-10-14 05:17
+
+import jwt
+from django.db import migrations, models
+
+
+def copy_jti_from_token(apps, schema_editor):
+    TokenBlacklist = apps.get_model('users', 'TokenBlacklist')
+    for entry in TokenBlacklist.objects.all():
+        try:
+            payload = jwt.decode(entry.token, options={'verify_signature': False})
+        except jwt.DecodeError:
+            continue
+        entry.jti = payload.get('jti', '')
+        entry.save(update_fields=['jti'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0003_rename_token_blacklist_token_idx_token_black_token_6a50c6_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tokenblacklist',
+            name='jti',
+            field=models.CharField(default='', max_length=255),
+            preserve_default=False,
+        ),
+        migrations.RunPython(copy_jti_from_token, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='tokenblacklist',
+            name='token_black_token_6a50c6_idx',
+        ),
+        migrations.RemoveField(
+            model_name='tokenblacklist',
+            name='token',
+        ),
+    ]
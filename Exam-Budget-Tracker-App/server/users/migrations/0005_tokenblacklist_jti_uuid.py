@@ -0,0 +1,36 @@
+# Generated by Django 4.2.11 on 2026-10-14 05:18
+
+import uuid
+
+from django.db import migrations, models
+
+
+def drop_unusable_jtis(apps, schema_editor):
+    """Remove rows whose jti is not a UUID or repeats, so the column can become a unique uuid"""
+    TokenBlacklist = apps.get_model('users', 'TokenBlacklist')
+    seen = set()
+    for entry in TokenBlacklist.objects.order_by('id'):
+        try:
+            jti = uuid.UUID(entry.jti)
+        except ValueError:
+            jti = None
+        if jti is None or jti in seen:
+            entry.delete()
+        else:
+            seen.add(jti)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_tokenblacklist_jti'),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_unusable_jtis, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='tokenblacklist',
+            name='jti',
+            field=models.UUIDField(unique=True),
+        ),
+    ]
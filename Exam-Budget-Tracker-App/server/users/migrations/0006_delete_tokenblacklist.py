@@ -0,0 +1,16 @@
+# Generated by Django 4.2.11 on 2026-10-14 05:43
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0005_tokenblacklist_jti_uuid'),
+    ]
+
+    operations = [
+        migrations.DeleteModel(
+            name='TokenBlacklist',
+        ),
+    ]
@@ -1,13 +1,23 @@
 from django.db import models
-from django.contrib.auth.models import AbstractUser
+from django.contrib.auth.models import AbstractUser, UserManager as DjangoUserManager
 from rest_framework_simplejwt.tokens import RefreshToken
 
 
+class UserManager(DjangoUserManager):
+    def get_by_natural_key(self, username):
+        """Login lookup: load only what ModelBackend checks; other fields load on access"""
+        return self.only('id', 'password', 'is_active', self.model.USERNAME_FIELD).get(
+            **{self.model.USERNAME_FIELD: username}
+        )
+
+
 class User(AbstractUser):
     email = models.EmailField(unique=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = UserManager()
+
     groups = models.ManyToManyField(
         'auth.Group',
         verbose_name='groups',
@@ -26,16 +36,3 @@ class User(AbstractUser):
 
     def __str__(self):
         return self.username
-
-class TokenBlacklist(models.Model):
-    token = models.TextField()
-    blacklisted_at = models.DateTimeField(auto_now_add=True)
-
-    class Meta:
-        db_table = 'token_blacklist'
-        indexes = [
-            models.Index(fields=['token']),
-        ]
-
-    def __str__(self):
-        return f"Token blacklisted at {self.blacklisted_at}"
\ No newline at end of file
@@ -1,13 +1,37 @@
 from rest_framework import serializers
 from django.contrib.auth.password_validation import validate_password
+from django.contrib.auth.validators import UnicodeUsernameValidator
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from api.serializers import CachedFieldsMixin
 from .models import User
+from .tokens import BlacklistCheckedRefreshToken
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ['id', 'username', 'email', 'first_name', 'last_name']
-        read_only_fields = ['id']
+        # Output-only: no writable fields means no model validators or UniqueValidators to build
+        read_only_fields = fields
+
+
+# Duplicate usernames/emails are caught by the unique constraints on INSERT, not pre-checked
+UNIQUE_FIELD_ERRORS = {
+    'username': 'This username is already taken.',
+    'email': 'This email is already registered.',
+}
+
+
+def _unique_violation_field(error):
+    """Name of the field whose unique constraint raised `error`, if any"""
+    diag = getattr(error.__cause__, 'diag', None)
+    source = getattr(diag, 'constraint_name', None) or str(error)
+    for field in UNIQUE_FIELD_ERRORS:
+        if field in source:
+            return field
+    return None
 
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
@@ -36,38 +60,60 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         fields = ['username', 'email', 'password', 'password_confirm']
         extra_kwargs = {
             'username': {
+                # No UniqueValidator: it would SELECT before the INSERT does the same check
+                'validators': [UnicodeUsernameValidator()],
                 'error_messages': {
                     'required': 'Username is required.',
                     'blank': 'Username cannot be blank.',
-                    'unique': 'This username is already taken.',
                 }
             },
             'email': {
+                'validators': [],
                 'error_messages': {
                     'required': 'Email is required.',
                     'blank': 'Email cannot be blank.',
                     'invalid': 'Enter a valid email address.',
-                    'unique': 'This email is already registered.',
                 }
             },
         }
 
-    def validate_username(self, value):
-        if User.objects.filter(username=value).exists():
-            raise serializers.ValidationError('This username is already taken.')
-        return value
-
-    def validate_email(self, value):
-        if User.objects.filter(email=value).exists():
-            raise serializers.ValidationError('This email is already registered.')
-        return value
-
     def validate(self, data):
+        # Both values come from the same request, so a plain compare is fine here: no
+        # compare_digest needed, and str != already returns early on a length mismatch
         if data['password'] != data['password_confirm']:
             raise serializers.ValidationError({'password_confirm': 'Passwords do not match.'})
         return data
 
     def create(self, validated_data):
         validated_data.pop('password_confirm')
-        user = User.objects.create_user(**validated_data)
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(**validated_data)
+        except IntegrityError as e:
+            field = _unique_violation_field(e)
+            if field is None:
+                raise
+            # Failure path only: one indexed query finds every taken field, not just the first
+            fields = self._taken_fields(validated_data) or {field}
+            raise serializers.ValidationError({
+                name: [message] for name, message in UNIQUE_FIELD_ERRORS.items() if name in fields
+            })
         return user
+
+    @staticmethod
+    def _taken_fields(validated_data):
+        username = User.normalize_username(validated_data['username'])
+        email = User.objects.normalize_email(validated_data['email'])
+        taken = set()
+        for existing_username, existing_email in User.objects.filter(
+            Q(username=username) | Q(email=email)
+        ).values_list('username', 'email'):
+            if existing_username == username:
+                taken.add('username')
+            if existing_email == email:
+                taken.add('email')
+        return taken
+
+
+class BlacklistCheckedTokenRefreshSerializer(TokenRefreshSerializer):
+    token_class = BlacklistCheckedRefreshToken
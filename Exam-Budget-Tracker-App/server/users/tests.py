@@ -1,31 +1,49 @@
+from functools import lru_cache
+
 import pytest
 from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache, caches
 from rest_framework.test import APIClient
 from rest_framework import status
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from .models import TokenBlacklist
+from .blacklist import blacklist_token, clear_local_cache, is_blacklisted
 
 User = get_user_model()
 
+@lru_cache(maxsize=None)
+def _hashed():
+    """Hash once on first use, under the test hasher; fixtures store it instead of hashing per test"""
+    return make_password('SecurePass123!')
+
+
+def make_user(username, email, pw_hash=None):
+    """Create a user directly, skipping the register endpoint and password hashing"""
+    return User.objects.create(username=username, email=email, password=pw_hash or _hashed())
 
-@pytest.fixture
+
+@pytest.fixture(scope='module')
 def api_client():
     return APIClient()
 
 
-@pytest.fixture
-def test_user():
-    user = User.objects.create_user(
-        username='testuser',
-        email='testuser@example.com',
-        password='SecurePass123!'
-    )
-    return user
+@pytest.fixture(autouse=True)
+def _reset_creds(api_client):
+    """Keep one test's Authorization header out of the next"""
+    yield
+    api_client.credentials()
+
 
+@pytest.fixture(scope='class')
+def test_user(class_db):
+    with class_db.unblock():
+        return make_user('testuser', 'testuser@example.com')
 
-@pytest.fixture
+
+@pytest.fixture(scope='class')
 def test_user_tokens(test_user):
+    """Sign test_user's tokens once per class; the blacklist is cleared per test, so reusing them is safe"""
     refresh = RefreshToken.for_user(test_user)
     return {
         'access': str(refresh.access_token),
@@ -85,6 +103,7 @@ class TestUserRegistration:
         response = api_client.post('/api/users/register/', data)
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert 'username' in response.data
+        assert response.data['username'] == ['This username is already taken.']
 
     def test_register_with_duplicate_email_returns_400(self, api_client, test_user):
         """Test registration fails with duplicate email"""
@@ -97,6 +116,47 @@ class TestUserRegistration:
         response = api_client.post('/api/users/register/', data)
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert 'email' in response.data
+        assert response.data['email'] == ['This email is already registered.']
+
+    def test_register_with_duplicate_username_and_email_reports_both(self, api_client, test_user):
+        """Test both conflicting fields are reported in one response"""
+        data = {
+            'username': 'testuser',
+            'email': 'testuser@example.com',
+            'password': 'SecurePass123!',
+            'password_confirm': 'SecurePass123!',
+        }
+        response = api_client.post('/api/users/register/', data)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data['username'] == ['This username is already taken.']
+        assert response.data['email'] == ['This email is already registered.']
+
+    def test_register_hashes_password_with_argon2id(self, api_client, settings):
+        """Test new passwords are stored as Argon2id hashes"""
+        settings.PASSWORD_HASHERS = ['users.hashers.TunedArgon2PasswordHasher']
+        data = {
+            'username': 'newuser',
+            'email': 'newuser@example.com',
+            'password': 'SecurePass123!',
+            'password_confirm': 'SecurePass123!',
+        }
+        api_client.post('/api/users/register/', data)
+        user = User.objects.get(username='newuser')
+        assert user.password.startswith('argon2$argon2id$')
+        assert user.check_password('SecurePass123!')
+
+    def test_register_checks_uniqueness_without_select(self, api_client, django_assert_max_num_queries):
+        """Test registration relies on the unique constraints instead of pre-check queries"""
+        data = {
+            'username': 'newuser',
+            'email': 'newuser@example.com',
+            'password': 'SecurePass123!',
+            'password_confirm': 'SecurePass123!',
+        }
+        with django_assert_max_num_queries(3) as captured:
+            response = api_client.post('/api/users/register/', data)
+        assert response.status_code == status.HTTP_201_CREATED
+        assert not [q for q in captured.captured_queries if q['sql'].startswith('SELECT')]
 
     def test_register_without_username_returns_400(self, api_client):
         """Test registration fails when username is missing"""
@@ -148,6 +208,16 @@ class TestUserRegistration:
 
 @pytest.mark.django_db
 class TestUserLogin:
+    def test_login_loads_only_credential_columns(self, api_client, test_user, django_assert_num_queries):
+        """Test the login lookup does not fetch profile columns"""
+        data = {'username': 'testuser', 'password': 'SecurePass123!'}
+        with django_assert_num_queries(1) as captured:
+            response = api_client.post('/api/token/', data)
+        assert response.status_code == status.HTTP_200_OK
+        select_clause = captured.captured_queries[0]['sql'].split(' FROM ')[0]
+        assert '"email"' not in select_clause
+        assert '"password"' in select_clause
+
     def test_login_with_valid_credentials_returns_tokens(self, api_client, test_user):
         """Test successful login returns access and refresh tokens"""
         data = {
@@ -277,6 +347,38 @@ class TestAuthenticatedEndpoints:
         response = api_client.get('/api/users/me/')
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
+    def test_get_me_for_deleted_user_returns_401(self, api_client, test_user, test_user_tokens):
+        """Test a valid token is rejected once its user no longer exists"""
+        User.objects.filter(pk=test_user.pk).delete()
+        api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {test_user_tokens["access"]}')
+        response = api_client.get('/api/users/me/')
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_get_me_for_inactive_user_returns_401(self, api_client, test_user, test_user_tokens):
+        """Test a valid token is rejected once its user is deactivated"""
+        User.objects.filter(pk=test_user.pk).update(is_active=False)
+        api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {test_user_tokens["access"]}')
+        response = api_client.get('/api/users/me/')
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_list_users_selects_only_rendered_columns(self, api_client, test_user, test_user_tokens, django_assert_num_queries):
+        """Test the user list does not load password hashes or other unused columns"""
+        api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {test_user_tokens["access"]}')
+        with django_assert_num_queries(3) as captured:
+            response = api_client.get('/api/users/')
+        assert response.status_code == status.HTTP_200_OK
+        page_query = captured.captured_queries[-1]['sql']
+        assert '"password"' not in page_query.split(' FROM ')[0]
+
+    def test_user_routes_reject_writes(self, api_client, test_user, test_user_tokens):
+        """Test the user list and detail routes are read-only; accounts come from register"""
+        api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {test_user_tokens["access"]}')
+        assert api_client.post('/api/users/', {}).status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+        assert api_client.put(f'/api/users/{test_user.pk}/', {'username': 'renamed'}).status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+        assert api_client.patch(f'/api/users/{test_user.pk}/', {'username': 'renamed'}).status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+        assert api_client.delete(f'/api/users/{test_user.pk}/').status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+        assert list(User.objects.values_list('username', flat=True)) == ['testuser']
+
     def test_get_me_returns_correct_user_data_format(self, api_client, test_user, test_user_tokens):
         """Test /me endpoint returns expected fields"""
         api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {test_user_tokens["access"]}')
@@ -313,9 +415,56 @@ class TestLogout:
         """Test that logout actually blacklists the token"""
         api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {test_user_tokens["access"]}')
         data = {'refresh_token': test_user_tokens['refresh']}
-        initial_count = TokenBlacklist.objects.count()
         api_client.post('/api/users/logout/', data)
-        assert TokenBlacklist.objects.count() == initial_count + 1
+        clear_local_cache()
+        assert is_blacklisted(RefreshToken(test_user_tokens['refresh'])['jti'])
+
+    def test_refresh_with_blacklisted_token_returns_401(self, api_client, test_user_tokens):
+        """Test that a logged-out refresh token can no longer be refreshed"""
+        api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {test_user_tokens["access"]}')
+        api_client.post('/api/users/logout/', {'refresh_token': test_user_tokens['refresh']})
+
+        api_client.credentials()
+        response = api_client.post('/api/token/refresh/', {'refresh': test_user_tokens['refresh']})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_refresh_stays_rejected_after_default_cache_fills(self, api_client, test_user_tokens):
+        """Test that culling the default cache cannot drop a blacklist entry"""
+        api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {test_user_tokens["access"]}')
+        api_client.post('/api/users/logout/', {'refresh_token': test_user_tokens['refresh']})
+
+        for index in range(1000):
+            cache.set(f'filler:{index}', index)
+        clear_local_cache()
+
+        api_client.credentials()
+        response = api_client.post('/api/token/refresh/', {'refresh': test_user_tokens['refresh']})
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_logout_twice_with_same_token_returns_400(self, api_client, test_user_tokens):
+        """Test that an already blacklisted token is rejected on a second logout"""
+        api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {test_user_tokens["access"]}')
+        data = {'refresh_token': test_user_tokens['refresh']}
+        api_client.post('/api/users/logout/', data)
+
+        response = api_client.post('/api/users/logout/', data)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_blacklist_lookups_are_memoized_in_process(self, test_user):
+        """Test that repeat lookups are answered without the shared cache"""
+        token = RefreshToken.for_user(test_user)
+        blacklist_token(token)
+        assert is_blacklisted(token['jti'])
+
+        caches['blacklist'].clear()
+        assert is_blacklisted(token['jti'])
+
+    def test_logout_with_access_token_returns_400(self, api_client, test_user_tokens):
+        """Test logout rejects an access token passed as the refresh token"""
+        api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {test_user_tokens["access"]}')
+        response = api_client.post('/api/users/logout/', {'refresh_token': test_user_tokens['access']})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not is_blacklisted(RefreshToken(test_user_tokens['refresh'])['jti'])
 
     def test_logout_with_invalid_refresh_token_returns_400(self, api_client, test_user_tokens):
         """Test logout fails with invalid refresh token"""
@@ -323,6 +472,14 @@ class TestLogout:
         data = {'refresh_token': 'invalid.token.here'}
         response = api_client.post('/api/users/logout/', data)
         assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {'detail': 'Invalid or expired refresh token.'}
+
+    def test_logout_with_malformed_refresh_token_returns_400(self, api_client, test_user_tokens):
+        """Test logout rejects a value that is not shaped like a JWT"""
+        api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {test_user_tokens["access"]}')
+        response = api_client.post('/api/users/logout/', {'refresh_token': 'not-a-jwt'})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {'detail': 'Invalid or expired refresh token.'}
 
 
 @pytest.mark.django_db
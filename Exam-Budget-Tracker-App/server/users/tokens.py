@@ -0,0 +1,36 @@
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.exceptions import TokenBackendError, TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.state import token_backend
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from .blacklist import is_blacklisted
+
+
+class BlacklistCheckedRefreshToken(RefreshToken):
+    """Refresh token that fails verification once its jti has been blacklisted"""
+
+    def verify(self):
+        super().verify()
+        if is_blacklisted(self[api_settings.JTI_CLAIM]):
+            raise TokenError(_('Token is blacklisted'))
+
+
+def decode_refresh_token(raw_token):
+    """Verify a raw refresh token with one signature check and return its claims
+
+    A lighter stand-in for BlacklistCheckedRefreshToken(raw_token) where only the
+    claims are needed; raises TokenError on the same conditions.
+    """
+    try:
+        payload = token_backend.decode(raw_token, verify=True)
+    except TokenBackendError:
+        raise TokenError(_('Token is invalid or expired'))
+    if payload.get(api_settings.TOKEN_TYPE_CLAIM) != RefreshToken.token_type:
+        raise TokenError(_('Token has wrong type'))
+    jti = payload.get(api_settings.JTI_CLAIM)
+    if jti is None:
+        raise TokenError(_('Token has no id'))
+    if is_blacklisted(jti):
+        raise TokenError(_('Token is blacklisted'))
+    return payload
@@ -2,16 +2,27 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
-from rest_framework_simplejwt.tokens import RefreshToken
-from .models import User, TokenBlacklist
+from rest_framework_simplejwt.exceptions import TokenError
+from .blacklist import blacklist_token
+from .models import User
 from .serializers import UserSerializer, UserRegistrationSerializer
+from .tokens import decode_refresh_token
 
+# Static logout payloads, built once instead of per request
+REFRESH_TOKEN_REQUIRED = {'detail': 'Refresh token is required.'}
+LOGGED_OUT = {'detail': 'Successfully logged out.'}
+INVALID_REFRESH_TOKEN = {'detail': 'Invalid or expired refresh token.'}
 
-class UserViewSet(viewsets.ModelViewSet):
+
+class UserViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated]
 
+    def get_queryset(self):
+        """Load only the columns UserSerializer renders; one many=True serializer covers the page"""
+        return User.objects.only(*UserSerializer.Meta.fields).order_by('id')
+
     @action(detail=False, methods=['post'], permission_classes=[AllowAny])
     def register(self, request):
         serializer = UserRegistrationSerializer(data=request.data)
@@ -22,27 +33,29 @@ class UserViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=['get'])
     def me(self, request):
-        serializer = self.get_serializer(request.user)
-        return Response(serializer.data)
+        # Same shape as UserSerializer, built directly on this hot path
+        user = request.user
+        return Response({
+            'id': user.id,
+            'username': user.username,
+            'email': user.email,
+            'first_name': user.first_name,
+            'last_name': user.last_name,
+        })
 
     @action(detail=False, methods=['post'])
     def logout(self, request):
+        refresh_token = request.data.get('refresh_token')
+        if not refresh_token:
+            return Response(REFRESH_TOKEN_REQUIRED, status=status.HTTP_400_BAD_REQUEST)
+
+        # A JWT is header.payload.signature; reject anything else without raising
+        if not isinstance(refresh_token, str) or refresh_token.count('.') != 2:
+            return Response(INVALID_REFRESH_TOKEN, status=status.HTTP_400_BAD_REQUEST)
         try:
-            refresh_token = request.data.get('refresh_token')
-            if not refresh_token:
-                return Response(
-                    {'detail': 'Refresh token is required.'},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
-            
-            token = RefreshToken(refresh_token)
-            TokenBlacklist.objects.create(token=str(token))
-            return Response(
-                {'detail': 'Successfully logged out.'},
-                status=status.HTTP_200_OK
-            )
-        except Exception as e:
-            return Response(
-                {'detail': f'Invalid token: {str(e)}'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+            claims = decode_refresh_token(refresh_token)
+        except TokenError:
+            return Response(INVALID_REFRESH_TOKEN, status=status.HTTP_400_BAD_REQUEST)
+
+        blacklist_token(claims)
+        return Response(LOGGED_OUT, status=status.HTTP_200_OK)